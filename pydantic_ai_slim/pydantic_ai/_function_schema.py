@@ -44,6 +44,8 @@ class FunctionSchema:
     single_arg_name: str | None = None
     positional_fields: list[str] = field(default_factory=list)
     var_positional_field: str | None = None
+    # if True, the function takes no arguments (besides potentially `ctx`), so an empty call needs no validation
+    takes_no_args: bool = False
 
     async def call(self, args_dict: dict[str, Any], ctx: RunContext[Any]) -> Any:
         args, kwargs = self._call_args(args_dict, ctx)
@@ -77,6 +79,7 @@ def function_schema(  # noqa: C901
     takes_ctx: bool | None = None,
     docstring_format: DocstringFormat = 'auto',
     require_parameter_descriptions: bool = False,
+    skip_description: bool = False,
 ) -> FunctionSchema:
     """Build a Pydantic validator and JSON schema from a tool function.
 
@@ -86,6 +89,8 @@ def function_schema(  # noqa: C901
         docstring_format: The docstring format to use.
         require_parameter_descriptions: Whether to require descriptions for all tool function parameters.
         schema_generator: The JSON schema generator class to use.
+        skip_description: Whether the description is provided elsewhere, in which case the docstring is only parsed
+            if the function has parameters that may be described in it.
 
     Returns:
         A `FunctionSchema` instance.
@@ -112,7 +117,11 @@ def function_schema(  # noqa: C901
     var_positional_field: str | None = None
     decorators = _decorators.DecoratorInfos()
 
-    description, field_descriptions = doc_descriptions(function, sig, docstring_format=docstring_format)
+    if skip_description and len(sig.parameters) <= (1 if takes_ctx else 0):
+        # the docstring can't describe any parameters, and we don't need its description
+        description, field_descriptions = None, {}
+    else:
+        description, field_descriptions = doc_descriptions(function, sig, docstring_format=docstring_format)
 
     if require_parameter_descriptions:
         if takes_ctx:
@@ -219,6 +228,7 @@ def function_schema(  # noqa: C901
         single_arg_name=single_arg_name,
         positional_fields=positional_fields,
         var_positional_field=var_positional_field,
+        takes_no_args=not fields and var_kwargs_schema is None and single_arg_name is None,
         takes_ctx=takes_ctx,
         is_async=is_async_callable(function),
         function=function,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -27,9 +28,12 @@ class InstrumentationNames:
     output_tool_span_name: str
 
     @classmethod
+    @cache
     def for_version(cls, version: int) -> Self:
         """Create instrumentation configuration for a specific version.
 
+        Instances are immutable, so the configuration for each version is only created once.
+
         Args:
             version: The instrumentation version (1, 2, or 3+)
 
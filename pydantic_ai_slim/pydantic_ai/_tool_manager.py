@@ -4,10 +4,12 @@ import json
 from collections.abc import Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
+from copy import copy
 from dataclasses import dataclass, field, replace
+from functools import cache
 from typing import Any, Generic
 
-from opentelemetry.trace import Tracer
+from opentelemetry.trace import NoOpTracer, Tracer
 from pydantic import ValidationError
 from typing_extensions import assert_never
 
@@ -15,7 +17,7 @@ from . import messages as _messages
 from ._instrumentation import InstrumentationNames
 from ._run_context import AgentDepsT, RunContext
 from .exceptions import ModelRetry, ToolRetryError, UnexpectedModelBehavior
-from .messages import ToolCallPart
+from .messages import ToolCallPart, tool_return_ta
 from .tools import ToolDefinition
 from .toolsets.abstract import AbstractToolset, ToolsetTool
 from .usage import RunUsage
@@ -52,11 +54,13 @@ class ToolManager(Generic[AgentDepsT]):
             if ctx.run_step == self.ctx.run_step:
                 return self
 
-            retries = {
-                failed_tool_name: self.ctx.retries.get(failed_tool_name, 0) + 1
-                for failed_tool_name in self.failed_tools
-            }
-            ctx = replace(ctx, retries=retries)
+            # On the happy path no tools failed, so there are no retries to carry over or reset
+            if self.failed_tools or ctx.retries:
+                retries = {
+                    failed_tool_name: self.ctx.retries.get(failed_tool_name, 0) + 1
+                    for failed_tool_name in self.failed_tools
+                }
+                ctx = replace(ctx, retries=retries)
 
         return self.__class__(
             toolset=self.toolset,
@@ -141,20 +145,27 @@ class ToolManager(Generic[AgentDepsT]):
             if tool.tool_def.defer:
                 raise RuntimeError('Deferred tools cannot be called')
 
-            ctx = replace(
-                self.ctx,
-                tool_name=name,
-                tool_call_id=call.tool_call_id,
-                retry=self.ctx.retries.get(name, 0),
-                max_retries=tool.max_retries,
-            )
+            # A shallow copy is much cheaper than `dataclasses.replace`, which re-runs `__init__` for every field
+            ctx = copy(self.ctx)
+            ctx.tool_name = name
+            ctx.tool_call_id = call.tool_call_id
+            ctx.retry = self.ctx.retries.get(name, 0)
+            ctx.max_retries = tool.max_retries
 
+            args = call.args
             pyd_allow_partial = 'trailing-strings' if allow_partial else 'off'
-            validator = tool.args_validator
-            if isinstance(call.args, str):
-                args_dict = validator.validate_json(call.args or '{}', allow_partial=pyd_allow_partial)
+            if args:
+                if isinstance(args, str):
+                    args_dict = tool.args_validator.validate_json(args, allow_partial=pyd_allow_partial)
+                else:
+                    args_dict = tool.args_validator.validate_python(args, allow_partial=pyd_allow_partial)
+            elif tool.takes_no_args:
+                # There's nothing to validate when a tool without parameters is called without arguments
+                args_dict: dict[str, Any] = {}
+            elif isinstance(args, str):
+                args_dict = tool.args_validator.validate_json('{}', allow_partial=pyd_allow_partial)
             else:
-                args_dict = validator.validate_python(call.args or {}, allow_partial=pyd_allow_partial)
+                args_dict = tool.args_validator.validate_python({}, allow_partial=pyd_allow_partial)
 
             result = await self.toolset.call_tool(name, args_dict, ctx, tool)
 
@@ -168,6 +179,8 @@ class ToolManager(Generic[AgentDepsT]):
             else:
                 if wrap_validation_errors:
                     if isinstance(e, ValidationError):
+                        # The structured errors (including `input`) are part of the public `RetryPromptPart.content`
+                        # and what `model_response()` renders for the model, so they can't be replaced by `e.json()`
                         m = _messages.RetryPromptPart(
                             tool_name=name,
                             content=e.errors(include_url=False, include_context=False),
@@ -201,53 +214,65 @@ class ToolManager(Generic[AgentDepsT]):
         usage: RunUsage,
     ) -> Any:
         """See <https://opentelemetry.io/docs/specs/semconv/gen-ai/gen-ai-spans/#execute-tool-span>."""
+        if type(tracer) is NoOpTracer:
+            # Instrumentation is disabled, so don't bother building span attributes for a span that won't be recorded
+            tool_result = await self._call_tool(call, allow_partial, wrap_validation_errors)
+            usage.tool_calls += 1
+            return tool_result
+
         instrumentation_names = InstrumentationNames.for_version(instrumentation_version)
 
-        span_attributes = {
-            'gen_ai.tool.name': call.tool_name,
-            # NOTE: this means `gen_ai.tool.call.id` will be included even if it was generated by pydantic-ai
-            'gen_ai.tool.call.id': call.tool_call_id,
-            **({instrumentation_names.tool_arguments_attr: call.args_as_json_str()} if include_content else {}),
-            'logfire.msg': f'running tool: {call.tool_name}',
-            # add the JSON schema so these attributes are formatted nicely in Logfire
-            'logfire.json_schema': json.dumps(
-                {
-                    'type': 'object',
-                    'properties': {
-                        **(
-                            {
-                                instrumentation_names.tool_arguments_attr: {'type': 'object'},
-                                instrumentation_names.tool_result_attr: {'type': 'object'},
-                            }
-                            if include_content
-                            else {}
-                        ),
-                        'gen_ai.tool.name': {},
-                        'gen_ai.tool.call.id': {},
-                    },
-                }
-            ),
-        }
+        # NOTE: this means `gen_ai.tool.call.id` will be included even if it was generated by pydantic-ai
+        if include_content:
+            span_attributes = {
+                'gen_ai.tool.name': call.tool_name,
+                'gen_ai.tool.call.id': call.tool_call_id,
+                instrumentation_names.tool_arguments_attr: call.args_as_json_str(),
+                'logfire.msg': f'running tool: {call.tool_name}',
+                'logfire.json_schema': _tool_span_json_schema(instrumentation_version, True),
+            }
+        else:
+            span_attributes = {
+                'gen_ai.tool.name': call.tool_name,
+                'gen_ai.tool.call.id': call.tool_call_id,
+                'logfire.msg': f'running tool: {call.tool_name}',
+                'logfire.json_schema': _tool_span_json_schema(instrumentation_version, False),
+            }
         with tracer.start_as_current_span(
             instrumentation_names.get_tool_span_name(call.tool_name),
             attributes=span_attributes,
         ) as span:
+            # Whether a span records is decided when it starts, so we only need to check once
+            record_result = include_content and span.is_recording()
             try:
                 tool_result = await self._call_tool(call, allow_partial, wrap_validation_errors)
                 usage.tool_calls += 1
 
             except ToolRetryError as e:
-                part = e.tool_retry
-                if include_content and span.is_recording():
-                    span.set_attribute(instrumentation_names.tool_result_attr, part.model_response())
+                if record_result:
+                    span.set_attribute(instrumentation_names.tool_result_attr, e.tool_retry.model_response())
                 raise e
 
-            if include_content and span.is_recording():
+            if record_result:
                 span.set_attribute(
                     instrumentation_names.tool_result_attr,
-                    tool_result
-                    if isinstance(tool_result, str)
-                    else _messages.tool_return_ta.dump_json(tool_result).decode(),
+                    tool_result if isinstance(tool_result, str) else tool_return_ta.dump_json(tool_result).decode(),
                 )
 
         return tool_result
+
+
+@cache
+def _tool_span_json_schema(instrumentation_version: int, include_content: bool) -> str:
+    """Build the `logfire.json_schema` attribute for tool spans, so these attributes are formatted nicely in Logfire.
+
+    The result only depends on the instrumentation version and whether content is included, so it's computed once.
+    """
+    instrumentation_names = InstrumentationNames.for_version(instrumentation_version)
+    properties: dict[str, Any] = {}
+    if include_content:
+        properties[instrumentation_names.tool_arguments_attr] = {'type': 'object'}
+        properties[instrumentation_names.tool_result_attr] = {'type': 'object'}
+    properties['gen_ai.tool.name'] = {}
+    properties['gen_ai.tool.call.id'] = {}
+    return json.dumps({'type': 'object', 'properties': properties})
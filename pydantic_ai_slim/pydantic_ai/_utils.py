@@ -333,10 +333,23 @@ def get_traceparent(x: AgentRun | AgentRunResult | GraphRun | GraphRunResult) ->
 
 def dataclasses_no_defaults_repr(self: Any) -> str:
     """Exclude fields with values equal to the field default."""
-    kv_pairs = (
-        f'{f.name}={getattr(self, f.name)!r}' for f in fields(self) if f.repr and getattr(self, f.name) != f.default
-    )
-    return f'{self.__class__.__qualname__}({", ".join(kv_pairs)})'
+    cls = self.__class__
+    if self.__dataclass_fields__ is cls.__dataclass_fields__:
+        repr_fields = _cached_repr_fields(cls)
+    else:
+        # the instance overrides its fields (like `TemporalRunContext` does), so they can't be cached per class
+        repr_fields = _repr_fields(self)
+    kv_pairs = (f'{name}={value!r}' for name, default in repr_fields if (value := getattr(self, name)) != default)
+    return f'{cls.__qualname__}({", ".join(kv_pairs)})'
+
+
+def _repr_fields(class_or_instance: Any) -> tuple[tuple[str, Any], ...]:
+    """The names and defaults of a dataclass's fields included in its repr."""
+    return tuple((f.name, f.default) for f in fields(class_or_instance) if f.repr)
+
+
+_cached_repr_fields = functools.cache(_repr_fields)
+"""`_repr_fields` computed once per class."""
 
 
 _datetime_ta = TypeAdapter(datetime)
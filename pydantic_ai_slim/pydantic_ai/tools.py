@@ -4,7 +4,7 @@ from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import KW_ONLY, dataclass, field, replace
 from typing import Annotated, Any, Concatenate, Generic, Literal, TypeAlias, cast
 
-from pydantic import Discriminator, Tag
+from pydantic import Discriminator, Tag, ValidationError
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from pydantic_core import SchemaValidator, core_schema
 from typing_extensions import ParamSpec, Self, TypeVar
@@ -235,12 +235,17 @@ class GenerateToolJsonSchema(GenerateJsonSchema):
     def _named_required_fields_schema(self, named_required_fields: Sequence[tuple[str, bool, Any]]) -> JsonSchemaValue:
         # Remove largely-useless property titles
         s = super()._named_required_fields_schema(named_required_fields)
-        for p in s.get('properties', {}):
-            s['properties'][p].pop('title', None)
+        if properties := s.get('properties'):
+            for property_schema in properties.values():
+                property_schema.pop('title', None)
         return s
 
 
-@dataclass(init=False)
+_ANY_SCHEMA_VALIDATOR = SchemaValidator(schema=core_schema.any_schema())
+"""Validator for tools created from a JSON schema, whose arguments are passed through without validation."""
+
+
+@dataclass(init=False, slots=True)
 class Tool(Generic[AgentDepsT]):
     """A tool function for an agent."""
 
@@ -280,6 +285,7 @@ class Tool(Generic[AgentDepsT]):
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
         function_schema: _function_schema.FunctionSchema | None = None,
+        warmup: bool = False,
     ):
         """Create a new tool instance.
 
@@ -336,6 +342,8 @@ class Tool(Generic[AgentDepsT]):
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
             function_schema: The function schema to use for the tool. If not provided, it will be generated.
+            warmup: Whether to run the argument validator once when the tool is created, so any one-off setup cost
+                is paid up front rather than on the first tool call. Defaults to False.
         """
         self.function = function
         self.function_schema = function_schema or _function_schema.function_schema(
@@ -344,6 +352,7 @@ class Tool(Generic[AgentDepsT]):
             takes_ctx=takes_ctx,
             docstring_format=docstring_format,
             require_parameter_descriptions=require_parameter_descriptions,
+            skip_description=bool(description),
         )
         self.takes_ctx = self.function_schema.takes_ctx
         self.max_retries = max_retries
@@ -357,6 +366,12 @@ class Tool(Generic[AgentDepsT]):
         self.requires_approval = requires_approval
         self.metadata = metadata
 
+        if warmup:
+            try:
+                self.function_schema.validator.validate_json('{}')
+            except ValidationError:
+                pass
+
     @classmethod
     def from_schema(
         cls,
@@ -387,7 +402,7 @@ class Tool(Generic[AgentDepsT]):
         function_schema = _function_schema.FunctionSchema(
             function=function,
             description=description,
-            validator=SchemaValidator(schema=core_schema.any_schema()),
+            validator=_ANY_SCHEMA_VALIDATOR,
             json_schema=json_schema,
             takes_ctx=takes_ctx,
             is_async=_utils.is_async_callable(function),
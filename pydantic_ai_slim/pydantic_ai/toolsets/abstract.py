@@ -57,6 +57,8 @@ class ToolsetTool(Generic[AgentDepsT]):
 
     For example, a [`pydantic.TypeAdapter(...).validator`](https://docs.pydantic.dev/latest/concepts/type_adapter/) or [`pydantic_core.SchemaValidator`](https://docs.pydantic.dev/latest/api/pydantic_core/#pydantic_core.SchemaValidator).
     """
+    takes_no_args: bool = False
+    """Whether the tool takes no arguments, in which case a call without arguments is passed `{}` without running `args_validator`."""
 
 
 class AbstractToolset(ABC, Generic[AgentDepsT]):
@@ -78,6 +78,7 @@ class CombinedToolset(AbstractToolset[AgentDepsT]):
                     tool_def=tool.tool_def,
                     max_retries=tool.max_retries,
                     args_validator=tool.args_validator,
+                    takes_no_args=tool.takes_no_args,
                     source_toolset=toolset,
                     source_tool=tool,
                 )
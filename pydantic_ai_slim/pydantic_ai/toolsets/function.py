@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Sequence
-from dataclasses import dataclass, replace
+from copy import copy
+from dataclasses import dataclass
 from typing import Any, overload
 
 from pydantic.json_schema import GenerateJsonSchema
@@ -309,12 +310,10 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         tools: dict[str, ToolsetTool[AgentDepsT]] = {}
         for original_name, tool in self.tools.items():
             max_retries = tool.max_retries if tool.max_retries is not None else self.max_retries
-            run_context = replace(
-                ctx,
-                tool_name=original_name,
-                retry=ctx.retries.get(original_name, 0),
-                max_retries=max_retries,
-            )
+            run_context = copy(ctx)
+            run_context.tool_name = original_name
+            run_context.retry = ctx.retries.get(original_name, 0)
+            run_context.max_retries = max_retries
             tool_def = await tool.prepare_tool_def(run_context)
             if not tool_def:
                 continue
@@ -331,6 +330,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 tool_def=tool_def,
                 max_retries=max_retries,
                 args_validator=tool.function_schema.validator,
+                takes_no_args=tool.function_schema.takes_no_args,
                 call_func=tool.function_schema.call,
                 is_async=tool.function_schema.is_async,
             )
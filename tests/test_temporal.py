@@ -56,7 +56,13 @@ try:
     from temporalio.worker import Worker
     from temporalio.workflow import ActivityConfig
 
-    from pydantic_ai.durable_exec.temporal import AgentPlugin, LogfirePlugin, PydanticAIPlugin, TemporalAgent
+    from pydantic_ai.durable_exec.temporal import (
+        AgentPlugin,
+        LogfirePlugin,
+        PydanticAIPlugin,
+        TemporalAgent,
+        TemporalRunContext,
+    )
     from pydantic_ai.durable_exec.temporal._function_toolset import TemporalFunctionToolset
     from pydantic_ai.durable_exec.temporal._mcp_server import TemporalMCPServer
     from pydantic_ai.durable_exec.temporal._model import TemporalModel
@@ -2059,3 +2065,21 @@ async def test_image_agent(allow_model_requests: None, client: Client):
                 id=ImageAgentWorkflow.__name__,
                 task_queue=TASK_QUEUE,
             )
+
+
+def test_temporal_run_context_repr():
+    ctx = TemporalRunContext.deserialize_run_context(
+        {
+            'retries': {},
+            'tool_call_id': 'call_1',
+            'tool_name': 'my_tool',
+            'tool_call_approved': False,
+            'retry': 0,
+            'max_retries': 1,
+            'run_step': 1,
+        },
+        deps=None,
+    )
+    assert repr(ctx) == snapshot(
+        "TemporalRunContext(deps=None, retries={}, tool_call_id='call_1', tool_name='my_tool', max_retries=1, run_step=1)"
+    )
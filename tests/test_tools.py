@@ -8,9 +8,10 @@ import pydantic_core
 import pytest
 from _pytest.logging import LogCaptureFixture
 from inline_snapshot import snapshot
-from pydantic import BaseModel, Field, TypeAdapter, WithJsonSchema
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, WithJsonSchema
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from pydantic_core import PydanticSerializationError, core_schema
+from pytest_mock import MockerFixture
 from typing_extensions import TypedDict
 
 from pydantic_ai import (
@@ -30,13 +31,21 @@ from pydantic_ai import (
     ToolReturnPart,
     UserError,
     UserPromptPart,
+    _function_schema,
 )
 from pydantic_ai.exceptions import ApprovalRequired, CallDeferred, ModelRetry, UnexpectedModelBehavior
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.models.test import TestModel
 from pydantic_ai.output import ToolOutput
-from pydantic_ai.tools import DeferredToolRequests, DeferredToolResults, ToolApproved, ToolDefinition, ToolDenied
-from pydantic_ai.usage import RequestUsage
+from pydantic_ai.tools import (
+    DeferredToolRequests,
+    DeferredToolResults,
+    GenerateToolJsonSchema,
+    ToolApproved,
+    ToolDefinition,
+    ToolDenied,
+)
+from pydantic_ai.usage import RequestUsage, RunUsage
 
 from .conftest import IsDatetime, IsStr
 
@@ -1004,6 +1013,7 @@ def test_call_tool_without_unrequired_parameters():
                     ToolCallPart(tool_name='my_tool_plain', args={'b': 17}),
                     ToolCallPart(tool_name='my_tool_plain', args={'a': 4, 'b': 17}),
                     ToolCallPart(tool_name='no_args_tool', args=''),
+                    ToolCallPart(tool_name='default_args_tool', args=''),
                 ]
             )
         else:
@@ -1015,6 +1025,10 @@ def test_call_tool_without_unrequired_parameters():
     def no_args_tool() -> None:
         return None
 
+    @agent.tool_plain
+    def default_args_tool(a: int = 5) -> int:
+        return a
+
     @agent.tool
     def my_tool(ctx: RunContext[None], a: int, b: int = 2) -> int:
         return a + b
@@ -1038,9 +1052,88 @@ def test_call_tool_without_unrequired_parameters():
             {'b': 17},
             {'a': 4, 'b': 17},
             '',
+            '',
         ]
     )
-    assert tool_returns == snapshot([15, 17, 51, 68, None])
+    assert tool_returns == snapshot([15, 17, 51, 68, None, 5])
+
+
+def test_call_tool_without_parameters_skips_validation(mocker: MockerFixture):
+    def call_tools_first(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(
+                parts=[
+                    ToolCallPart(tool_name='no_args_tool', args=None),
+                    ToolCallPart(tool_name='no_args_tool', args=''),
+                ]
+            )
+        else:
+            return ModelResponse(parts=[TextPart('finished')])
+
+    def no_args_tool() -> str:
+        return 'done'
+
+    tool = Tool(no_args_tool)
+    validator = mocker.patch.object(tool.function_schema, 'validator')
+
+    agent = Agent(FunctionModel(call_tools_first), tools=[tool])
+    result = agent.run_sync('Hello')
+    second_request = result.all_messages()[2]
+    assert isinstance(second_request, ModelRequest)
+    assert [p.content for p in second_request.parts if isinstance(p, ToolReturnPart)] == snapshot(['done', 'done'])
+    validator.validate_json.assert_not_called()
+    validator.validate_python.assert_not_called()
+
+
+def test_call_tool_with_empty_model_argument_without_args():
+    class Empty(BaseModel):
+        model_config = ConfigDict(extra='forbid')
+
+    def call_tools_first(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(
+                parts=[
+                    ToolCallPart(tool_name='empty_model_tool', args=None),
+                    ToolCallPart(tool_name='empty_model_tool', args=''),
+                ]
+            )
+        else:
+            return ModelResponse(parts=[TextPart('finished')])
+
+    agent = Agent(FunctionModel(call_tools_first))
+
+    @agent.tool_plain
+    def empty_model_tool(e: Empty) -> str:
+        return type(e).__name__
+
+    result = agent.run_sync('Hello')
+    second_request = result.all_messages()[2]
+    assert isinstance(second_request, ModelRequest)
+    assert [p.content for p in second_request.parts if isinstance(p, ToolReturnPart)] == snapshot(['Empty', 'Empty'])
+
+
+def test_call_tool_with_parameters_hidden_by_prepare_without_args():
+    def call_tools_first(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(parts=[ToolCallPart(tool_name='hidden_args_tool', args=None)])
+        else:
+            return ModelResponse(parts=[TextPart('finished')])
+
+    async def hide_parameters(ctx: RunContext[None], tool_def: ToolDefinition) -> ToolDefinition:
+        return replace(
+            tool_def, parameters_json_schema={'type': 'object', 'properties': {}, 'additionalProperties': False}
+        )
+
+    def hidden_args_tool(x: int) -> int:
+        return x  # pragma: no cover
+
+    agent = Agent(FunctionModel(call_tools_first), tools=[Tool(hidden_args_tool, prepare=hide_parameters)])
+    result = agent.run_sync('Hello')
+    second_request = result.all_messages()[2]
+    assert isinstance(second_request, ModelRequest)
+    retry_part = second_request.parts[0]
+    assert isinstance(retry_part, RetryPromptPart)
+    assert retry_part.content == snapshot([{'type': 'missing', 'loc': ('x',), 'msg': 'Field required', 'input': {}}])
 
 
 def test_schema_generator():
@@ -1163,6 +1256,95 @@ def test_dynamic_tools_agent_wide():
     assert result.output == snapshot('{"foobar":"1 0 a"}')
 
 
+async def test_prepare_mutation_does_not_leak_between_tools():
+    def foobar(x: int) -> str:
+        return str(x)  # pragma: no cover
+
+    async def prepare(ctx: RunContext[None], tool_def: ToolDefinition) -> ToolDefinition:
+        tool_def.parameters_json_schema['properties']['x']['description'] = 'Modified by prepare'
+        return tool_def
+
+    ctx = RunContext(deps=None, model=TestModel(), usage=RunUsage())
+    prepared_tool = Tool(foobar, prepare=prepare)
+    other_tool = Tool(foobar)
+
+    prepared_tool_def = await prepared_tool.prepare_tool_def(ctx)
+    assert prepared_tool_def is not None
+    assert prepared_tool_def.parameters_json_schema['properties']['x'] == snapshot(
+        {'description': 'Modified by prepare', 'type': 'integer'}
+    )
+    assert other_tool.function_schema.json_schema['properties']['x'] == snapshot({'type': 'integer'})
+
+
+def test_docstring_not_parsed_for_provided_description(mocker: MockerFixture):
+    def no_args(ctx: RunContext[None]) -> str:
+        """Docstring description."""
+        return 'done'  # pragma: no cover
+
+    def with_args(x: int) -> str:
+        """Docstring description.
+
+        Args:
+            x: The x.
+        """
+        return str(x)  # pragma: no cover
+
+    doc_descriptions = mocker.spy(_function_schema, 'doc_descriptions')
+
+    tool = Tool(no_args, description='Provided description.')
+    assert tool.description == 'Provided description.'
+    assert doc_descriptions.call_count == 0
+
+    tool = Tool(with_args, description='Provided description.')
+    assert tool.description == 'Provided description.'
+    assert tool.function_schema.json_schema['properties']['x']['description'] == 'The x.'
+    assert doc_descriptions.call_count == 1
+
+    assert Tool(no_args).description == 'Docstring description.'
+
+
+def test_tool_warmup(mocker: MockerFixture):
+    def no_args() -> str:
+        return 'done'  # pragma: no cover
+
+    def required_args(x: int) -> str:
+        return str(x)  # pragma: no cover
+
+    no_args_schema = _function_schema.function_schema(no_args, GenerateToolJsonSchema)
+    validate_json = mocker.spy(no_args_schema.validator, 'validate_json')
+
+    Tool(no_args, function_schema=no_args_schema)
+    validate_json.assert_not_called()
+
+    Tool(no_args, function_schema=no_args_schema, warmup=True)
+    validate_json.assert_called_once_with('{}')
+
+    # a validation error from the warmup call is swallowed
+    required_args_schema = _function_schema.function_schema(required_args, GenerateToolJsonSchema)
+    validate_json = mocker.spy(required_args_schema.validator, 'validate_json')
+
+    Tool(required_args, function_schema=required_args_schema, warmup=True)
+    validate_json.assert_called_once_with('{}')
+    assert isinstance(validate_json.spy_exception, ValidationError)
+
+
+async def test_tool_def_not_shared_between_steps():
+    def foobar(x: int) -> str:
+        return str(x)  # pragma: no cover
+
+    ctx = RunContext(deps=None, model=TestModel(), usage=RunUsage())
+    tool = Tool(foobar)
+
+    tool_def = await tool.prepare_tool_def(ctx)
+    assert tool_def is not None
+    tool_def.description = 'Modified by prepare_tools'
+
+    next_tool_def = await tool.prepare_tool_def(ctx)
+    assert next_tool_def is not tool_def
+    assert next_tool_def is not None
+    assert next_tool_def.description is None
+
+
 def test_function_tool_consistent_with_schema():
     def function(*args: Any, **kwargs: Any) -> str:
         assert len(args) == 0
@@ -1216,6 +1398,24 @@ def test_function_tool_from_schema_with_ctx():
     assert agent._function_toolset.tools['foobar'].max_retries == 0
 
 
+def test_function_tool_from_schema_subclass_init():
+    class LabelledTool(Tool[None]):
+        label: str
+
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.label = 'labelled'
+
+    def function(**kwargs: Any) -> str:
+        return 'done'  # pragma: no cover
+
+    tool = LabelledTool.from_schema(
+        function, name='foobar', description='does foobar stuff', json_schema={'type': 'object', 'properties': {}}
+    )
+    assert isinstance(tool, LabelledTool)
+    assert tool.label == 'labelled'
+
+
 def test_function_tool_inconsistent_with_schema():
     def function(three: str, four: int) -> str:
         return 'Coverage made me call this'
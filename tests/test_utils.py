@@ -5,6 +5,7 @@ import contextvars
 import functools
 import os
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from importlib.metadata import distributions
 
 import pytest
@@ -14,7 +15,9 @@ from pydantic_ai import UserError
 from pydantic_ai._utils import (
     UNSET,
     PeekableAsyncStream,
+    _cached_repr_fields,  # pyright: ignore[reportPrivateUsage]
     check_object_json_schema,
+    dataclasses_no_defaults_repr,
     group_by_temporal,
     is_async_callable,
     merge_json_schema_defs,
@@ -541,3 +544,25 @@ def test_validate_empty_kwargs_preserves_order():
     assert '`first`' in error_msg
     assert '`second`' in error_msg
     assert '`third`' in error_msg
+
+
+def test_dataclasses_no_defaults_repr():
+    @dataclass(repr=False)
+    class Point:
+        x: int
+        y: int = 0
+        label: str = field(default='', repr=False)
+
+        __repr__ = dataclasses_no_defaults_repr
+
+    cached_repr_fields = _cached_repr_fields.cache_info()
+    assert repr(Point(1)) == snapshot('test_dataclasses_no_defaults_repr.<locals>.Point(x=1)')
+    assert repr(Point(1, 2, 'a')) == snapshot('test_dataclasses_no_defaults_repr.<locals>.Point(x=1, y=2)')
+    # the repr fields are looked up once per class
+    assert _cached_repr_fields.cache_info().misses == cached_repr_fields.misses + 1
+
+    # fields overridden on the instance are honored, and don't affect other instances
+    point = Point(1, 2)
+    setattr(point, '__dataclass_fields__', {'y': Point.__dataclass_fields__['y']})
+    assert repr(point) == snapshot('test_dataclasses_no_defaults_repr.<locals>.Point(y=2)')
+    assert repr(Point(1, 2)) == snapshot('test_dataclasses_no_defaults_repr.<locals>.Point(x=1, y=2)')